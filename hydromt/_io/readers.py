@@ -2,8 +2,11 @@
 
 import logging
 from ast import literal_eval
+from copy import deepcopy
+from functools import lru_cache
 from glob import glob
 from io import IOBase
+from os import stat
 from os.path import abspath, basename, dirname, isfile, join, splitext
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Tuple, Union
@@ -48,6 +51,7 @@ __all__ = [
     "_open_timeseries_from_table",
     "_read_yaml",
     "_read_toml",
+    "_read_yaml_or_toml",
 ]
 
 OPEN_VECTOR_PREDICATE = Literal[
@@ -875,6 +879,7 @@ def _read_nc(
     mask_and_scale: bool = False,
     single_var_as_array: bool = True,
     load: bool = False,
+    chunks: Optional[Union[int, str, Dict[str, int]]] = None,
     **kwargs,
 ) -> Dict[str, Union[xr.Dataset, xr.DataArray]]:
     """Read netcdf files at <root>/<file> and return as dict of xarray.Dataset.
@@ -898,6 +903,11 @@ def _read_nc(
         If False, always return a Dataset. By default True.
     load : bool, optional
         If True, the data is loaded into memory. By default False.
+    chunks : int, str or dict, optional
+        If not None, the data is opened lazily as dask arrays with these chunks, see
+        :py:func:`xarray.open_dataset`. Use an empty dict to match the on-disk
+        chunks of each variable, which is recommended for large files as it avoids
+        reading full variables at once. By default None (no dask arrays).
     **kwargs:
         Additional keyword arguments that are passed to the `xr.open_dataset`
         function.
@@ -919,11 +929,13 @@ def _read_nc(
         # Load data to allow overwriting in r+ mode
         if load:
             ds: Union[xr.Dataset, xr.DataArray] = xr.open_dataset(
-                path, mask_and_scale=mask_and_scale, **kwargs
+                path, mask_and_scale=mask_and_scale, chunks=chunks, **kwargs
             ).load()
             ds.close()
         else:
-            ds = xr.open_dataset(path, mask_and_scale=mask_and_scale, **kwargs)
+            ds = xr.open_dataset(
+                path, mask_and_scale=mask_and_scale, chunks=chunks, **kwargs
+            )
         # set geo coord if present as coordinate of dataset
         if GEO_MAP_COORD in ds.data_vars:
             ds = ds.set_coords(GEO_MAP_COORD)
@@ -954,12 +966,36 @@ def _read_toml(path: StrPath) -> Dict[str, Any]:
     return data
 
 
+@lru_cache(maxsize=32)
+def _read_yaml_or_toml_cached(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse a yaml or toml file, cached per path and file modification."""
+    if splitext(path)[-1] == ".toml":
+        return _read_toml(path)
+    return _read_yaml(path)
+
+
+def _read_yaml_or_toml(path: StrPath) -> Dict[str, Any]:
+    """Read a yaml or toml file, based on its extension, and return as dict.
+
+    Parsed files are cached, as the same data catalogs and config templates are
+    often read by many model instances. A copy is returned as the content is
+    modified in place by the callers.
+    """
+    path = abspath(path)
+    file_stat = stat(path)
+    return deepcopy(
+        _read_yaml_or_toml_cached(path, file_stat.st_mtime_ns, file_stat.st_size)
+    )
+
+
 def _yml_from_uri_or_path(uri_or_path: StrPath) -> Dict[str, Any]:
     if _is_valid_url(str(uri_or_path)):
         with fetch(str(uri_or_path), stream=True) as r:
             r.raise_for_status()
             yml = _parse_yaml(r.text)
 
+    elif isfile(str(uri_or_path)):
+        yml = _read_yaml_or_toml(uri_or_path)
     else:
         yml = _read_yaml(uri_or_path)
     return yml
@@ -12,17 +12,23 @@ import geopandas as gpd
 import numpy as np
 import xarray as xr
 from tomli_w import dump as dump_toml
+from tomli_w import dumps as dumps_toml
 from yaml import dump as dump_yaml
 
 from hydromt._typing.type_def import DeferedFileClose, StrPath, XArrayDict
 
+try:  # use the libyaml based emitter if available, which is much faster
+    from yaml import CDumper as YamlDumper
+except ImportError:
+    from yaml import Dumper as YamlDumper  # type: ignore[assignment]
+
 logger: Logger = getLogger(__name__)
 
 
 def _write_yaml(path: StrPath, data: Dict[str, Any]):
     """Write a dictionary to a yaml formatted file."""
     with open(path, "w") as f:
-        dump_yaml(data, f)
+        dump_yaml(data, f, Dumper=YamlDumper)
 
 
 def _write_toml(path: StrPath, data: Dict[str, Any]):
@@ -31,6 +37,16 @@ def _write_toml(path: StrPath, data: Dict[str, Any]):
         dump_toml(data, f)
 
 
+def _dump_yaml(data: Dict[str, Any]) -> str:
+    """Return a dictionary as yaml formatted string."""
+    return dump_yaml(data, Dumper=YamlDumper)
+
+
+def _dump_toml(data: Dict[str, Any]) -> str:
+    """Return a dictionary as toml formatted string."""
+    return dumps_toml(data)
+
+
 def _write_xy(path, gdf, fmt="%.4f"):
     """Write geopandas.GeoDataFrame with Point geometries to point xy files.
 
@@ -119,6 +135,52 @@ def _zarr_writer(
     return write_path
 
 
+def _nc_encoding(
+    ds: Union[xr.Dataset, xr.DataArray],
+    chunksizes: Optional[Dict[str, int]] = None,
+    compress: bool = False,
+) -> Dict[str, Dict[str, Any]]:
+    """Return a netcdf encoding with consistent chunks for all data variables.
+
+    Parameters
+    ----------
+    ds: xarray.Dataset or xarray.DataArray
+        Data to derive the encoding for.
+    chunksizes: dict, optional
+        Chunk size per dimension. Dimensions which are not present are not chunked.
+        If an empty dict is given, the (first) dask chunk size of each dimension is
+        used for dask-backed data. By default None, i.e. no chunks are set.
+    compress: bool, optional
+        If True, compress all data variables with zlib. By default False.
+
+    Returns
+    -------
+    Dict[str, Dict[str, Any]]
+        Encoding per data variable
+    """
+    if isinstance(ds, xr.DataArray):
+        if ds.name is None:
+            return {}
+        ds = ds.to_dataset()
+    encoding: Dict[str, Dict[str, Any]] = {}
+    for name, da in ds.data_vars.items():
+        enc: Dict[str, Any] = {}
+        if compress:
+            enc["zlib"] = True
+        if chunksizes is not None and da.ndim > 0:
+            if chunksizes == {} and da.chunks is not None:
+                sizes = [chunks[0] for chunks in da.chunks]
+            else:
+                sizes = [chunksizes.get(str(dim), n) for dim, n in da.sizes.items()]
+            # netcdf does not allow chunks larger than the dimension size
+            enc["chunksizes"] = tuple(
+                max(min(size, n), 1) for size, n in zip(sizes, da.shape)
+            )
+        if enc:
+            encoding[str(name)] = enc
+    return encoding
+
+
 def _write_nc(
     nc_dict: XArrayDict,
     filename_template: str,
@@ -128,6 +190,8 @@ def _write_nc(
     rename_dims: bool = False,
     force_sn: bool = False,
     force_overwrite: bool = False,
+    chunksizes: Optional[Dict[str, int]] = None,
+    compress: bool = False,
     **kwargs,
 ) -> Optional[DeferedFileClose]:
     """Write dictionnary of xarray.Dataset and/or xarray.DataArray to netcdf files.
@@ -160,10 +224,18 @@ def _write_nc(
     force_sn: bool, optional
         If True, forces the dataset to have South -> North orientation. Only used
         if ``gdal_compliant`` is set to True. By default, False.
+    chunksizes: dict, optional
+        Chunk size per dimension used for all data variables. Use an empty dict to
+        write dask-backed data with its dask chunks. Consistent chunks allow for
+        efficient lazy reading. By default None, i.e. no chunks are set.
+    compress: bool, optional
+        If True, compress all data variables with zlib. By default False.
     **kwargs:
         Additional keyword arguments that are passed to the `to_netcdf`
-        function.
+        function. A user defined ``encoding`` takes precedence over the
+        encoding derived from ``chunksizes`` and ``compress``.
     """
+    user_encoding: Dict[str, Dict[str, Any]] = kwargs.pop("encoding", None) or {}
     for name, ds in nc_dict.items():
         if not isinstance(ds, (xr.Dataset, xr.DataArray)) or len(ds) == 0:
             logger.error(f"{name} object of type {type(ds).__name__} not recognized")
@@ -176,14 +248,19 @@ def _write_nc(
             os.makedirs(dirname(_path))
         if gdal_compliant:
             ds = ds.raster.gdal_compliant(rename_dims=rename_dims, force_sn=force_sn)
+        encoding = user_encoding
+        if chunksizes is not None or compress:
+            encoding = _nc_encoding(ds, chunksizes=chunksizes, compress=compress)
+            for var, enc in user_encoding.items():
+                encoding[var] = {**encoding.get(var, {}), **enc}
         try:
-            ds.to_netcdf(_path, **kwargs)
+            ds.to_netcdf(_path, encoding=encoding or None, **kwargs)
         except PermissionError:
             logger.warning(f"Could not write to file {_path}, defering write")
             temp_data_dir = TemporaryDirectory()
 
             temp_path = join(str(temp_data_dir), f"{_path}.tmp")
-            ds.to_netcdf(temp_path, **kwargs)
+            ds.to_netcdf(temp_path, encoding=encoding or None, **kwargs)
 
             return DeferedFileClose(
                 ds=ds,
@@ -218,4 +295,5 @@ def _write_region(
     ):
         gdf = gdf.to_crs(4326)
 
+    write_kwargs = {**{"engine": "pyogrio"}, **write_kwargs}
     gdf.to_file(write_path, **write_kwargs)
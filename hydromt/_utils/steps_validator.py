@@ -1,5 +1,5 @@
 import inspect
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Tuple
 
 if TYPE_CHECKING:
     from hydromt.model.model import Model
@@ -9,7 +9,17 @@ from hydromt._utils.rgetattr import _rgetattr
 __all__ = ["_validate_steps"]
 
 
-def _validate_steps(model: "Model", steps: list[dict[str, dict[str, Any]]]) -> None:
+def _validate_steps(
+    model: "Model", steps: list[dict[str, dict[str, Any]]]
+) -> List[Tuple[str, Callable, Dict[str, Any]]]:
+    """Validate the steps and resolve them to the methods of the model to call.
+
+    Returns
+    -------
+    List[Tuple[str, Callable, Dict[str, Any]]]
+        List of (step name, method, keyword arguments) in the order of ``steps``.
+    """
+    resolved = []
     for step_dict in steps:
         step, options = next(iter(step_dict.items()))
         attr = _rgetattr(model, step, None)
@@ -26,3 +36,5 @@ def _validate_steps(model: "Model", steps: list[dict[str, dict[str, Any]]]) -> N
         sig = inspect.signature(attr)
         options = options or {}
         _ = sig.bind(**options)
+        resolved.append((step, attr, options))
+    return resolved
@@ -122,7 +122,7 @@ class DataFrameAdapter(DataAdapterBase):
         """
         if variables is not None:
             variables = np.atleast_1d(variables).tolist()
-            if np.any([var not in df.columns for var in variables]):
+            if any(var not in df.columns for var in variables):
                 raise ValueError(f"DataFrame: Not all variables found: {variables}")
             df = df.loc[:, variables]
 
@@ -138,7 +138,7 @@ class GeoDataFrameAdapter(DataAdapterBase):
         """
         if variables is not None:
             variables = np.atleast_1d(variables).tolist()
-            if np.any([var not in gdf.columns for var in variables]):
+            if any(var not in gdf.columns for var in variables):
                 raise ValueError(f"GeoDataFrame: Not all variables found: {variables}")
             if "geometry" not in variables:  # always keep geometry column
                 variables = variables + ["geometry"]
@@ -535,13 +535,10 @@ class XRasterBase(XGeoBase):
         if b == d == 0:
             xs = (c, c + a * self.width)
             ys = (f, f + e * self.height)
-        else:  # rotated
-            c0x, c0y = c, f
-            c1x, c1y = transform * (0, self.height)
-            c2x, c2y = transform * (self.width, self.height)
-            c3x, c3y = transform * (self.width, 0)
-            xs = (c0x, c1x, c2x, c3x)
-            ys = (c0y, c1y, c2y, c3y)
+        else:  # rotated; transform the corners (0, 0), (0, h), (w, h) and (w, 0)
+            w, h = self.width, self.height
+            xs = (c, b * h + c, a * w + b * h + c, a * w + c)
+            ys = (f, e * h + f, d * w + e * h + f, d * w + f)
         return min(xs), min(ys), max(xs), max(ys)
 
     @property
@@ -192,13 +192,13 @@ def merge(
             # clip with buffer
             src_bbox = da_out.raster.transform_bounds(da.raster.crs)
             da = da.raster.clip_bbox(src_bbox, buffer=10)
-            if np.any([da[dim].size == 0 for dim in da.raster.dims]):
+            if any(da[dim].size == 0 for dim in da.raster.dims):
                 continue  # out of bounds
             # reproject
             da = da.raster.reproject(**kwargs)
         # clip to dst_bounds
         da = da.raster.clip_bbox(dst_bounds)
-        if np.any([da[dim].size == 0 for dim in da.raster.dims]):
+        if any(da[dim].size == 0 for dim in da.raster.dims):
             continue  # out of bounds
         if "source_file" in da.attrs:
             sf_lst.append(da.attrs["source_file"])
@@ -1,13 +1,14 @@
 """A component to write configuration files for model simulations/kernels."""
 
+from functools import lru_cache
 from logging import Logger, getLogger
-from os import makedirs
+from os import makedirs, stat
 from os.path import abspath, dirname, isabs, isfile, join, splitext
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple, Union, cast
 
-from hydromt._io.readers import _read_toml, _read_yaml
-from hydromt._io.writers import _write_toml, _write_yaml
+from hydromt._io.readers import _read_yaml_or_toml
+from hydromt._io.writers import _dump_toml, _dump_yaml
 from hydromt._utils.path import _make_config_paths_relative
 from hydromt.model.components.base import ModelComponent
 from hydromt.model.steps import hydromt_step
@@ -17,6 +18,15 @@ if TYPE_CHECKING:
 
 logger: Logger = getLogger(__name__)
 
+_CONFIG_EXTENSIONS = (".yml", ".yaml", ".toml")
+
+
+@lru_cache(maxsize=256)
+def _split_key(key: str) -> Tuple[Tuple[str, ...], str]:
+    """Split a dotted config key into its branches and leaf, cached per key."""
+    *branches, leaf = key.split(".")
+    return tuple(branches), leaf
+
 
 class ConfigComponent(ModelComponent):
     """
@@ -54,6 +64,8 @@ class ConfigComponent(ModelComponent):
         self._data: Optional[Dict[str, Any]] = None
         self._filename: str = filename
         self._default_template_filename: Optional[str] = default_template_filename
+        # (path, modification time, text) of the last write, to skip unchanged writes
+        self._written: Optional[Tuple[str, int, str]] = None
 
         super().__init__(model=model)
 
@@ -79,7 +91,10 @@ class ConfigComponent(ModelComponent):
         self,
         path: Optional[str] = None,
     ) -> None:
-        """Write model config at <root>/{path}."""
+        """Write model config at <root>/{path}.
+
+        The file is not rewritten if it is unchanged since the last write.
+        """
         self.root._assert_write_mode()
         if self.data:
             p = path or self._filename
@@ -91,15 +106,34 @@ class ConfigComponent(ModelComponent):
             write_data = _make_config_paths_relative(self.data, self.root.path)
             ext = splitext(p)[-1]
             if ext in [".yml", ".yaml"]:
-                _write_yaml(write_path, write_data)
+                text = _dump_yaml(write_data)
             elif ext == ".toml":
-                _write_toml(write_path, write_data)
+                text = _dump_toml(write_data)
             else:
                 raise ValueError(f"Unknown file extension: {ext}")
+            # compare the serialized text, as values such as arrays cannot be
+            # compared with ==
+            if self._is_written(write_path, text):
+                logger.debug("Model config is unchanged on disk, skip writing.")
+                return
+            with open(write_path, "wb") as f:
+                f.write(text.encode())
+            self._written = (abspath(write_path), stat(write_path).st_mtime_ns, text)
 
         else:
             logger.debug("Model config has no data, skip writing.")
 
+    def _is_written(self, write_path: str, text: str) -> bool:
+        """Check if text was last written to write_path and the file is unchanged."""
+        if self._written is None or not isfile(write_path):
+            return False
+        path, mtime_ns, written_text = self._written
+        return (
+            path == abspath(write_path)
+            and mtime_ns == stat(write_path).st_mtime_ns
+            and written_text == text
+        )
+
     @hydromt_step
     def read(self, path: Optional[str] = None) -> None:
         """Read model config at <root>/{path}."""
@@ -117,13 +151,10 @@ class ConfigComponent(ModelComponent):
             return
 
         ext = splitext(p)[-1]
-        # Always overwrite config when reading
-        if ext in [".yml", ".yaml"]:
-            self._data = _read_yaml(read_path)
-        elif ext == ".toml":
-            self._data = _read_toml(read_path)
-        else:
+        if ext not in _CONFIG_EXTENSIONS:
             raise ValueError(f"Unknown file extension: {ext}")
+        # Always overwrite config when reading
+        self._data = _read_yaml_or_toml(read_path)
 
     def set(self, key: str, value: Any):
         """Update the config dictionary at key(s) with values.
@@ -150,16 +181,14 @@ class ConfigComponent(ModelComponent):
             >> {'a': 99, 'b': {'c': {'d': 24}}}
         """
         self._initialize()
-        parts = key.split(".")
-        num_parts = len(parts)
         current = cast(Dict[str, Any], self._data)
-        for i, part in enumerate(parts):
-            if part not in current or not isinstance(current[part], dict):
-                current[part] = {}
-            if i < num_parts - 1:
-                current = current[part]
-            else:
-                current[part] = value
+        branches, leaf = _split_key(key)
+        for part in branches:
+            branch = current.get(part)
+            if not isinstance(branch, dict):
+                branch = current[part] = {}
+            current = branch
+        current[leaf] = value
 
     def get_value(self, key: str, fallback=None, abs_path: bool = False) -> Any:
         """Get a config value at key(s).
@@ -194,15 +223,16 @@ class ConfigComponent(ModelComponent):
         >> {'d': 2}
 
         """
-        parts = key.split(".")
-        num_parts = len(parts)
-        current = self.data  # reads config at first call
         value = fallback
-        for i, part in enumerate(parts):
-            if i < num_parts - 1:
-                current = current.get(part, {})
-            else:
-                value = current.get(part, fallback)
+        current = self.data  # reads config at first call
+        branches, leaf = _split_key(key)
+        for part in branches:
+            current = current.get(part)
+            if not isinstance(current, dict):
+                # stop at the first missing or non-dict branch
+                break
+        else:
+            value = current.get(leaf, fallback)
 
         if abs_path and isinstance(value, (str, Path)):
             value = Path(value)
@@ -261,12 +291,9 @@ class ConfigComponent(ModelComponent):
         template = Path(template)
         # Here directly overwrite config with template
         logger.info(f"Creating model config from {prefix} template: {template}")
-        if template.suffix in [".yml", ".yaml"]:
-            self._data = _read_yaml(template)
-        elif template.suffix == ".toml":
-            self._data = _read_toml(template)
-        else:
+        if template.suffix not in _CONFIG_EXTENSIONS:
             raise ValueError(f"Unknown file extension: {template.suffix}")
+        self._data = _read_yaml_or_toml(template)
 
     @hydromt_step
     def update(self, data: Dict[str, Any]):
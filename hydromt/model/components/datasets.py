@@ -20,6 +20,51 @@ if TYPE_CHECKING:
 logger: Logger = getLogger(__name__)
 
 
+def _set_xarray_dict(
+    store: XArrayDict,
+    data: Union[Dataset, DataArray, DataFrame],
+    name: Optional[str] = None,
+    split_dataset: bool = False,
+) -> None:
+    """Add data to a dictionary of xarray objects.
+
+    Arguments
+    ---------
+    store: dict
+        Dictionary of xarray objects to update.
+    data: xarray.Dataset, xarray.DataArray or pandas.DataFrame
+        New data to add, a DataFrame is converted to a Dataset.
+    name: str, optional
+        name of the xarray.
+    split_dataset: bool, optional
+        If True, add each variable of a Dataset as a separate DataArray.
+    """
+    if isinstance(data, DataFrame):
+        data = data.to_xarray()
+    if split_dataset:
+        if isinstance(data, Dataset):
+            ds: Dict[str, Union[Dataset, DataArray]] = {
+                str(name): data[name] for name in data.data_vars
+            }
+        else:
+            raise ValueError(
+                f"Can only split dataset for Datasets not for {type(data).__name__}"
+            )
+    elif name is not None:
+        ds = {name: data}
+    elif data.name is not None:
+        ds = {str(data.name): data}
+    else:
+        raise ValueError(
+            "Either name should be set, the data needs to have a name or split_dataset should be True"
+        )
+
+    overlap = [name for name in ds if name in store]
+    if overlap:
+        logger.warning(f"Replacing xarray: {', '.join(overlap)}")
+    store.update(ds)
+
+
 class DatasetsComponent(ModelComponent):
     """A component to manage collections of Xarray objects.
 
@@ -82,31 +127,8 @@ class DatasetsComponent(ModelComponent):
             name of the xarray.
         """
         self._initialize()
-        if isinstance(data, DataFrame):
-            data = data.to_xarray()
         assert self._data is not None
-        if split_dataset:
-            if isinstance(data, Dataset):
-                ds: Dict[str, Union[Dataset, DataArray]] = {
-                    str(name): data[name] for name in data.data_vars
-                }
-            else:
-                raise ValueError(
-                    f"Can only split dataset for Datasets not for {type(data).__name__}"
-                )
-        elif name is not None:
-            ds = {name: data}
-        elif data.name is not None:
-            ds = {str(data.name): data}
-        else:
-            raise ValueError(
-                "Either name should be set, the data needs to have a name or split_dataset should be True"
-            )
-
-        for name, d in ds.items():
-            if name in self._data:
-                logger.warning(f"Replacing xarray: {name}")
-            self._data[name] = d
+        _set_xarray_dict(self._data, data, name=name, split_dataset=split_dataset)
 
     @hydromt_step
     def read(
@@ -127,7 +149,8 @@ class DatasetsComponent(ModelComponent):
             if None, the path that was provided at init will be used.
         **kwargs:
             Additional keyword arguments that are passed to the
-            `hydromt.io.readers.read_nc` function.
+            `hydromt.io.readers.read_nc` function. Use ``chunks={}`` to read large
+            files lazily with their on-disk chunks.
         """
         self.root._assert_read_mode()
         self._initialize(skip_read=True)
@@ -179,8 +202,9 @@ class DatasetsComponent(ModelComponent):
             If True, forces the dataset to have South -> North orientation. Only used
             if ``gdal_compliant`` is set to True. By default, False.
         **kwargs:
-            Additional keyword arguments that are passed to the `to_netcdf`
-            function.
+            Additional keyword arguments that are passed to the `write_nc`
+            function, e.g. ``chunksizes`` to write consistent chunks for lazy
+            reading, or to the `to_netcdf` function.
         """
         self.root._assert_write_mode()
 
@@ -88,7 +88,8 @@ class GeomsComponent(SpatialModelComponent):
         # Use the total bounds of all geometries as region
         if len(self.data) == 0:
             return None
-        bounds = np.column_stack([geom.bounds for geom in self.data.values()])
+        # (n_geoms, 4) array with the total bounds of each geometry
+        bounds = np.array([geom.total_bounds for geom in self.data.values()])
         total_bounds = (
             bounds[:, 0].min(),
             bounds[:, 1].min(),
@@ -111,6 +112,11 @@ class GeomsComponent(SpatialModelComponent):
         """
         self._initialize()
         assert self._data is not None
+        if not isinstance(geom, (GeoDataFrame, GeoSeries)):
+            raise ValueError(
+                f"geom type {type(geom).__name__} not recognized, "
+                "should be geopandas GeoDataFrame or GeoSeries."
+            )
         if name in self._data:
             logger.warning(f"Replacing geom: {name}")
 
@@ -137,10 +143,11 @@ class GeomsComponent(SpatialModelComponent):
             if None, the path that was provided at init will be used.
         **kwargs:
             Additional keyword arguments that are passed to the
-            `geopandas.read_file` function.
+            `geopandas.read_file` function. By default the pyogrio engine is used.
         """
         self.root._assert_read_mode()
         self._initialize(skip_read=True)
+        kwargs = {**{"engine": "pyogrio"}, **kwargs}
         f = filename or self._filename
         read_path = self.root.path / f
         path_glob, _, regex = _expand_uri_placeholders(str(read_path))
@@ -173,13 +180,14 @@ class GeomsComponent(SpatialModelComponent):
             If True, the geoms will be reprojected to WGS84(EPSG:4326) before they are written.
         **kwargs:
             Additional keyword arguments that are passed to the
-            `geopandas.to_file` function.
+            `geopandas.to_file` function. By default the pyogrio engine is used.
         """
         self.root._assert_write_mode()
 
         if len(self.data) == 0:
             logger.debug("No geoms data found, skip writing.")
             return
+        kwargs = {**{"engine": "pyogrio"}, **kwargs}
 
         for name, gdf in self.data.items():
             if len(gdf) == 0:
@@ -227,12 +235,23 @@ class GeomsComponent(SpatialModelComponent):
             return eq, errors
         other_geoms = cast(GeomsComponent, other)
         for name, gdf in self.data.items():
-            if name not in other_geoms.data:
+            other_gdf = other_geoms.data.get(name)
+            if other_gdf is None:
                 errors[name] = "Geom not found in other component."
+                continue
+            # cheap checks first, before comparing all geometries
+            if len(gdf) != len(other_gdf):
+                errors[name] = (
+                    f"Number of geometries differ: {len(gdf)} != {len(other_gdf)}"
+                )
+                continue
+            if gdf.crs != other_gdf.crs:
+                errors[name] = f"CRS differ: {gdf.crs} != {other_gdf.crs}"
+                continue
             try:
                 assert_geodataframe_equal(
                     gdf,
-                    other_geoms.data[name],
+                    other_gdf,
                     check_like=True,
                     check_less_precise=True,
                 )
@@ -10,7 +10,7 @@ import pandas as pd
 import xarray as xr
 from affine import Affine
 from pyproj import CRS
-from shapely.geometry import box
+from shapely.geometry import Polygon, box
 
 from hydromt._io.readers import _read_nc
 from hydromt._io.writers import _write_nc
@@ -79,6 +79,15 @@ class GridComponent(SpatialModelComponent):
         )
         self._data: Optional[xr.Dataset] = None
         self._filename: str = filename
+        # cached (bounds, crs, box, epsg) to avoid the crs lookup on every access
+        self._region_cache: Optional[
+            Tuple[
+                Tuple[float, float, float, float],
+                Optional[CRS],
+                Polygon,
+                Optional[Union[int, CRS]],
+            ]
+        ] = None
 
     def set(
         self,
@@ -100,30 +109,34 @@ class GridComponent(SpatialModelComponent):
         self._initialize_grid()
         assert self._data is not None
 
-        name_required = isinstance(data, np.ndarray) or (
-            isinstance(data, xr.DataArray) and data.name is None
-        )
-        if name is None and name_required:
-            raise ValueError(f"Unable to set {type(data).__name__} data without a name")
+        # resolve the type once and collect the variables to add in a single branch
         if isinstance(data, np.ndarray):
+            if name is None:
+                raise ValueError("Unable to set ndarray data without a name")
             if data.shape != self._data.raster.shape:
                 raise ValueError("Shape of data and grid maps do not match")
             data = xr.DataArray(dims=self._data.raster.dims, data=data, name=name)
+            data_vars = {name: data}
         elif isinstance(data, xr.DataArray):
             if name is not None:
                 data.name = name
-            data = data.to_dataset()
-        elif not isinstance(data, xr.Dataset):
+            elif data.name is None:
+                raise ValueError("Unable to set DataArray data without a name")
+            data_vars = {data.name: data}
+        elif isinstance(data, xr.Dataset):
+            data_vars = {dvar: data[dvar] for dvar in data.data_vars}
+        else:
             raise ValueError(f"cannot set data of type {type(data).__name__}")
 
         if len(self._data) == 0:  # empty grid
-            self._data = data
+            self._data = data if isinstance(data, xr.Dataset) else xr.Dataset(data_vars)
         else:
-            for dvar in data.data_vars:
-                if dvar in self._data:
-                    if self.root.is_reading_mode():
+            if self.root.is_reading_mode():
+                for dvar in data_vars:
+                    if dvar in self._data:
                         logger.warning(f"Replacing grid map: {dvar}")
-                self._data[dvar] = data[dvar]
+            # update all variables at once to align with the grid only once
+            self._data.update(data_vars)
 
     @hydromt_step
     def write(
@@ -158,7 +171,8 @@ class GridComponent(SpatialModelComponent):
             Can contain `filename`, `to_wgs84`, and anything that will be passed to `GeoDataFrame.to_file`.
             If `filename` is not provided, self.region_filename will be used.
         **kwargs : dict
-            Additional keyword arguments to be passed to the `write_nc` method.
+            Additional keyword arguments to be passed to the `write_nc` method,
+            e.g. ``chunksizes`` to write consistent chunks for lazy reading.
         """
         self.root._assert_write_mode()
         region_options = region_options or {}
@@ -206,6 +220,7 @@ class GridComponent(SpatialModelComponent):
         (if they exist).
         **kwargs : dict
             Additional keyword arguments to be passed to the `read_nc` method.
+            Use ``chunks={}`` to read large files lazily with their on-disk chunks.
         """
         self.root._assert_read_mode()
         self._initialize_grid(skip_read=True)
@@ -346,19 +361,15 @@ class GridComponent(SpatialModelComponent):
     @property
     def crs(self) -> Optional[CRS]:
         """Returns coordinate reference system embedded in the model grid."""
-        if self.data.raster is None:
-            exec_nodata_strat(
-                msg="No grid data found for deriving crs",
-                strategy=NoDataStrategy.WARN,
-            )
-            return None
-        if self.data.raster.crs is None:
+        # the raster accessor caches the parsed crs; avoid re-parsing it here
+        crs = self.data.raster.crs
+        if crs is None:
             exec_nodata_strat(
                 msg="No crs found in grid data",
                 strategy=NoDataStrategy.WARN,
             )
             return None
-        return CRS(self.data.raster.crs)
+        return crs if isinstance(crs, CRS) else CRS(crs)
 
     @property
     def bounds(self) -> Optional[Tuple[float, float, float, float]]:
@@ -375,10 +386,17 @@ class GridComponent(SpatialModelComponent):
     def _region_data(self) -> Optional[gpd.GeoDataFrame]:
         """Returns the geometry of the model area of interest."""
         if len(self.data) > 0:
-            crs: Optional[Union[int, CRS]] = self.crs
-            if crs is not None and hasattr(crs, "to_epsg"):
-                crs = crs.to_epsg()  # not all CRS have an EPSG code
-            return gpd.GeoDataFrame(geometry=[box(*self.bounds)], crs=crs)
+            bounds = tuple(self.bounds)
+            crs: Optional[CRS] = self.crs
+            cache = self._region_cache
+            if cache is None or cache[0] != bounds or cache[1] != crs:
+                epsg: Optional[Union[int, CRS]] = crs
+                if crs is not None and hasattr(crs, "to_epsg"):
+                    epsg = crs.to_epsg()  # not all CRS have an EPSG code
+                cache = (bounds, crs, box(*bounds), epsg)
+                self._region_cache = cache
+            # return a new GeoDataFrame, as callers may modify it in place
+            return gpd.GeoDataFrame(geometry=[cache[2]], crs=cache[3])
         exec_nodata_strat(
             msg="No grid data found for deriving region", strategy=NoDataStrategy.WARN
         )
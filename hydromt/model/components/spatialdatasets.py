@@ -14,6 +14,7 @@ from hydromt._io.readers import _read_nc
 from hydromt._io.writers import _write_nc
 from hydromt._typing.type_def import DeferedFileClose, XArrayDict
 from hydromt.model.components.base import ModelComponent
+from hydromt.model.components.datasets import _set_xarray_dict
 from hydromt.model.components.spatial import SpatialModelComponent
 from hydromt.model.steps import hydromt_step
 
@@ -109,31 +110,8 @@ class SpatialDatasetsComponent(SpatialModelComponent):
             name of the xarray.
         """
         self._initialize()
-        if isinstance(data, DataFrame):
-            data = data.to_xarray()
         assert self._data is not None
-        if split_dataset:
-            if isinstance(data, Dataset):
-                ds = {str(name): data[name] for name in data.data_vars}
-            else:
-                raise ValueError(
-                    f"Can only split dataset for Datasets not for {type(data).__name__}"
-                )
-        elif name is not None:
-            ds = {name: data}
-        elif data.name is not None:
-            ds = {str(data.name): data}
-        else:
-            raise ValueError(
-                "Either name should be set, the data needs to have a name or split_dataset should be True"
-            )
-
-        ds = cast(XArrayDict, ds)
-
-        for name, d in ds.items():
-            if name in self._data:
-                logger.warning(f"Replacing xarray: {name}")
-            self._data[name] = d
+        _set_xarray_dict(self._data, data, name=name, split_dataset=split_dataset)
 
     @hydromt_step
     def read(
@@ -151,7 +129,8 @@ class SpatialDatasetsComponent(SpatialModelComponent):
             if None, the path that was provided at init will be used.
         **kwargs:
             Additional keyword arguments that are passed to the
-            `hydromt.io.readers.read_nc` function.
+            `hydromt.io.readers.read_nc` function. Use ``chunks={}`` to read large
+            files lazily with their on-disk chunks.
         """
         self.root._assert_read_mode()
         self._initialize(skip_read=True)
@@ -203,8 +182,9 @@ class SpatialDatasetsComponent(SpatialModelComponent):
             If True, forces the dataset to have South -> North orientation. Only used
             if ``gdal_compliant`` is set to True. By default, False.
         **kwargs:
-            Additional keyword arguments that are passed to the `to_netcdf`
-            function.
+            Additional keyword arguments that are passed to the `write_nc`
+            function, e.g. ``chunksizes`` to write consistent chunks for lazy
+            reading, or to the `to_netcdf` function.
         """
         self.root._assert_write_mode()
 
@@ -123,7 +123,7 @@ class TablesComponent(ModelComponent):
             tables_to_add = tables
 
         for df_name, df in tables_to_add.items():
-            if not (isinstance(df, pd.DataFrame) or isinstance(df, pd.Series)):
+            if not isinstance(df, (pd.DataFrame, pd.Series)):
                 raise ValueError(
                     "table type not recognized, should be pandas DataFrame or Series."
                 )
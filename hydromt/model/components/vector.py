@@ -230,7 +230,9 @@ class VectorComponent(SpatialModelComponent):
         if geometry_filename is not None and isfile(
             join(self.root.path, geometry_filename)
         ):
-            gdf = gpd.read_file(join(self.root.path, geometry_filename))
+            gdf = gpd.read_file(
+                join(self.root.path, geometry_filename), engine="pyogrio"
+            )
             # geom + netcdf data
             if filename is not None:
                 ds = GeoDataset.from_gdf(gdf, data_vars=ds)
@@ -346,13 +348,13 @@ class VectorComponent(SpatialModelComponent):
         elif filename is None:
             os.makedirs(dirname(join(self.root.path, geometry_filename)), exist_ok=True)
             gdf = ds.vector.to_gdf(**kwargs)
-            gdf.to_file(join(self.root.path, geometry_filename))
+            gdf.to_file(join(self.root.path, geometry_filename), engine="pyogrio")
         # write data to netcdf and geometry to geojson
         else:
             os.makedirs(dirname(join(self.root.path, geometry_filename)), exist_ok=True)
             # write geometry
             gdf = ds.vector.geometry.to_frame("geometry")
-            gdf.to_file(join(self.root.path, geometry_filename))
+            gdf.to_file(join(self.root.path, geometry_filename), engine="pyogrio")
             # write_nc requires dict - use dummy key
             _write_nc(
                 {"vector": ds.drop_vars("geometry")},
@@ -5,10 +5,11 @@ import logging
 import os
 import typing
 from abc import ABCMeta
+from functools import lru_cache
 from inspect import _empty, signature
 from os.path import isabs, isfile, join
 from pathlib import Path
-from typing import Any, Dict, List, Optional, TypeVar, Union, cast
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar, Union, cast
 
 import geopandas as gdp
 from pyproj import CRS
@@ -16,7 +17,6 @@ from pyproj import CRS
 from hydromt._io.readers import _read_yaml
 from hydromt._typing import StrPath
 from hydromt._typing.type_def import DeferedFileClose
-from hydromt._utils import _rgetattr
 from hydromt._utils.steps_validator import _validate_steps
 from hydromt.data_catalog import DataCatalog
 from hydromt.model.components import (
@@ -53,6 +53,7 @@ class Model(object, metaclass=ABCMeta):
         components: Optional[Dict[str, Any]] = None,
         mode: str = "w",
         data_libs: Optional[Union[List, str]] = None,
+        data_catalog: Optional[DataCatalog] = None,
         region_component: Optional[str] = None,
         **catalog_keys,
     ):
@@ -82,6 +83,9 @@ class Model(object, metaclass=ABCMeta):
             read/append/write mode, by default "w"
         data_libs : List[str], optional
             List of data catalog configuration files, by default None
+        data_catalog : DataCatalog, optional
+            Existing DataCatalog to use instead of creating a new one from
+            `data_libs`, by default None. Note that the catalog is not copied.
         region_component : str, optional
             The name of the region component in the components dictionary.
             If None, the model will can automatically determine the region component if there is only one `SpatialModelComponent`.
@@ -98,7 +102,13 @@ class Model(object, metaclass=ABCMeta):
         data_libs = data_libs or []
 
         # link to data
-        self.data_catalog = DataCatalog(data_libs=data_libs, **catalog_keys)
+        if data_catalog is None:
+            data_catalog = DataCatalog(data_libs=data_libs, **catalog_keys)
+        elif data_libs or catalog_keys:
+            raise ValueError(
+                "data_libs and catalog keyword arguments cannot be combined with data_catalog."
+            )
+        self.data_catalog = data_catalog
         """DataCatalog for data access"""
 
         # file system
@@ -250,21 +260,12 @@ class Model(object, metaclass=ABCMeta):
 
         """
         steps = steps or []
-        _validate_steps(self, steps)
+        resolved_steps = _validate_steps(self, steps)
 
-        for step_dict in steps:
-            step, kwargs = next(iter(step_dict.items()))
+        for step, method, kwargs in resolved_steps:
             logger.info(f"build: {step}")
             # Call the methods.
-            method = _rgetattr(self, step)
-            params = {
-                param: arg.default
-                for param, arg in signature(method).parameters.items()
-                if arg.default != _empty
-            }
-            merged = {**params, **kwargs}
-            for k, v in merged.items():
-                logger.info(f"{method}.{k}: {v}")
+            _log_method_options(method, kwargs)
             method(**kwargs)
 
         # If there are any write options included in the steps,
@@ -321,7 +322,7 @@ class Model(object, metaclass=ABCMeta):
             to a temporary file in case the original file cannot be written to.
         """
         steps = steps or []
-        _validate_steps(self, steps)
+        resolved_steps = _validate_steps(self, steps)
 
         # read current model
         if not self.root.is_writing_mode():
@@ -338,19 +339,10 @@ class Model(object, metaclass=ABCMeta):
             raise ValueError("Model region not found, setup model using `build` first.")
 
         # loop over methods from config file
-        for step_dict in steps:
-            step, kwargs = next(iter(step_dict.items()))
+        for step, method, kwargs in resolved_steps:
             logger.info(f"update: {step}")
             # Call the methods.
-            method = _rgetattr(self, step)
-            params = {
-                param: arg.default
-                for param, arg in signature(method).parameters.items()
-                if arg.default != _empty
-            }
-            merged = {**params, **kwargs}
-            for k, v in merged.items():
-                logger.info(f"{method}.{k}: {v}")
+            _log_method_options(method, kwargs)
             method(**kwargs)
 
         # If there are any write options included in the steps,
@@ -466,9 +458,10 @@ class Model(object, metaclass=ABCMeta):
             return False, {
                 "__class__": f"f{other.__class__} does not inherit from {self.__class__}."
             }
-        components = sorted(list(self.components.keys()))
-        components_other = sorted(list(other.components.keys()))
-        if components != components_other:
+        # compare the component names as sets, only sort them for the error message
+        if self.components.keys() != other.components.keys():
+            components = sorted(self.components)
+            components_other = sorted(other.components)
             return False, {
                 "components": f"Components do not match: {components} != {components_other}"
             }
@@ -482,6 +475,30 @@ class Model(object, metaclass=ABCMeta):
         return is_equal, errors
 
 
+@lru_cache(maxsize=None)
+def _method_defaults(func: Callable) -> Tuple[Tuple[str, Any], ...]:
+    """Return the (name, default) pairs of all parameters of func with a default.
+
+    The result is cached per function, as :py:func:`inspect.signature` is expensive.
+    """
+    return tuple(
+        (param, arg.default)
+        for param, arg in signature(func).parameters.items()
+        if arg.default is not _empty
+    )
+
+
+def _log_method_options(method: Callable, kwargs: Dict[str, Any]) -> None:
+    """Log the options (defaults updated with kwargs) a model step is called with."""
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    # cache on the underlying function of bound methods, which is shared by instances
+    func = getattr(method, "__func__", method)
+    merged = {**dict(_method_defaults(func)), **kwargs}
+    for k, v in merged.items():
+        logger.info(f"{method}.{k}: {v}")
+
+
 def _assert_isinstance(obj: Any, dtype: Any, name: str = ""):
     """Check if obj match typing or class (dtype)."""
     args = typing.get_args(dtype)
@@ -9,7 +9,7 @@ import pandas as pd
 import xarray as xr
 import xugrid as xu
 from pyproj import CRS
-from shapely.geometry import box
+from shapely import box
 
 from hydromt.data_catalog import DataCatalog
 from hydromt.gis import _gis_utils
@@ -243,14 +243,12 @@ def create_mesh2d_from_geom(
     ncol = round((xmax - xmin) / res)  # int((xmax - xmin) // res)
     nrow = round((ymax - ymin) / res)  # int((ymax - ymin) // res)
     dx, dy = res, -res
-    faces = []
-    for i in range(nrow):
-        top = ymax + i * dy
-        bottom = ymax + (i + 1) * dy
-        for j in range(ncol):
-            left = xmin + j * dx
-            right = xmin + (j + 1) * dx
-            faces.append(box(left, bottom, right, top))
+    # create all faces at once, ordered row by row from the top left
+    left, top = np.meshgrid(xmin + np.arange(ncol) * dx, ymax + np.arange(nrow) * dy)
+    right, bottom = np.meshgrid(
+        xmin + np.arange(1, ncol + 1) * dx, ymax + np.arange(1, nrow + 1) * dy
+    )
+    faces = box(left.ravel(), bottom.ravel(), right.ravel(), top.ravel())
     grid = gpd.GeoDataFrame(geometry=faces, crs=geom.crs)
     # clip to geom
     if clip_to_geom:
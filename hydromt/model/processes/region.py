@@ -329,7 +329,7 @@ def _parse_region_value(
         value = value.tolist()  # array to list
 
     if isinstance(value, list):
-        if np.all([isinstance(p0, int) and abs(p0) > 180 for p0 in value]):  # all int
+        if all(isinstance(p0, int) and abs(p0) > 180 for p0 in value):  # all int
             kwarg = dict(basid=value)
         elif len(value) == 4:  # 4 floats
             kwarg = dict(bbox=value)
@@ -2,7 +2,7 @@
 
 from logging import FileHandler, Logger, getLogger
 from os import makedirs, remove
-from os.path import dirname, exists, isdir, join
+from os.path import abspath, dirname, exists, isdir, join
 from pathlib import Path
 from shutil import SameFileError, copyfile
 from typing import Optional
@@ -91,13 +91,19 @@ class ModelRoot:
     ):
         """Update the file handler to save logs in self.path/hydromt.log. If a log file at old_path exists copy it to self.path and append."""
         new_path = join(self.path, "hydromt.log")
-        if old_path == new_path:
-            return
+        main_logger: Logger = getLogger("hydromt")
+        if old_path == self.path and not overwrite:
+            abs_new_path = abspath(new_path)
+            if any(
+                isinstance(handler, FileHandler)
+                and handler.baseFilename == abs_new_path
+                for handler in main_logger.handlers
+            ):
+                # root did not change and is already logged to
+                return
 
         makedirs(self.path, exist_ok=True)
 
-        main_logger: Logger = getLogger("hydromt")
-
         log_level = 20  # default, but overwritten by the level of active loggers
         for handler in main_logger.handlers:
             log_level = handler.level
@@ -114,7 +120,7 @@ class ModelRoot:
         if overwrite and exists(new_path):
             remove(new_path)
 
-        if old_path is not None and exists(old_path):
+        if old_path is not None and old_path != self.path:
             old_log_path = join(old_path, "hydromt.log")
             if exists(old_log_path):
                 try:
@@ -102,3 +102,15 @@ def test_validate_steps_correct_with_defaults():
     model.add_component("foo", FooComponent(model))
     _validate_steps(model, [{"foo.with_defaults": {"a": 1}}])
     _validate_steps(model, [{"foo.with_defaults": {"a": 1, "b": "3"}}])
+
+
+def test_validate_steps_returns_resolved_steps():
+    model = Model()
+    component = FooComponent(model)
+    model.add_component("foo", component)
+    resolved = _validate_steps(
+        model, [{"foo.with_defaults": {"a": 1}}, {"foo.create": {"a": 1, "b": "2"}}]
+    )
+    assert [step for step, _, _ in resolved] == ["foo.with_defaults", "foo.create"]
+    assert resolved[0][1] == component.with_defaults
+    assert resolved[0][2] == {"a": 1}
@@ -1,6 +1,8 @@
+import logging
 from os.path import abspath, isabs, isfile, join
 from pathlib import Path
 
+import numpy as np
 import pytest
 
 from hydromt._io.readers import _config_read, _read_yaml
@@ -61,6 +63,28 @@ def test_config_create_always_reads(tmpdir):
     assert config_component._data == config_data
 
 
+def test_config_create_from_cached_template(tmpdir):
+    template_path = join(tmpdir, "template.yaml")
+    _write_yaml(template_path, {"a": 1, "b": {"c": 2}})
+    components = []
+    for name in ["model1", "model2"]:
+        model = Model(root=join(tmpdir, name), mode="w")
+        component = ConfigComponent(model, default_template_filename=template_path)
+        model.add_component("config", component)
+        component.create()
+        components.append(component)
+    # modifying one config should not affect configs created from the same template
+    components[0].set("b.c", 3)
+    assert components[1].get_value("b.c") == 2
+    # changing the template invalidates the cache
+    _write_yaml(template_path, {"a": 10})
+    model = Model(root=join(tmpdir, "model3"), mode="w")
+    component = ConfigComponent(model, default_template_filename=template_path)
+    model.add_component("config", component)
+    component.create()
+    assert component.data == {"a": 10}
+
+
 def test_config_does_not_read_at_lazy_init(tmpdir):
     filename = "myconfig.yaml"
     config_path = join(tmpdir, filename)
@@ -123,6 +147,17 @@ def test_set_config(tmpdir):
     assert config_component.get_value("global.name") == "test"
 
 
+def test_get_config_non_dict_branch(tmpdir):
+    model = Model(root=tmpdir)
+    config_component = ConfigComponent(model)
+    model.add_component("config", config_component)
+    config_component.set("global.name", "test")
+    assert config_component.get_value("global.name.first", fallback=1) == 1
+    assert config_component.get_value("missing.name") is None
+    config_component.set("global.name.first", "test")
+    assert config_component.get_value("global") == {"name": {"first": "test"}}
+
+
 def test_write_config(tmpdir):
     model = Model(root=tmpdir)
     config_component = ConfigComponent(model)
@@ -136,6 +171,25 @@ def test_write_config(tmpdir):
     assert read_contents == {"global": {"name": "test"}}
 
 
+def test_write_config_skips_unchanged(tmpdir, caplog: pytest.LogCaptureFixture):
+    caplog.set_level(logging.DEBUG)
+    skip_msg = "Model config is unchanged on disk, skip writing."
+    model = Model(root=tmpdir)
+    config_component = ConfigComponent(model)
+    model.add_component("config", config_component)
+    config_component.set("global.name", "test")
+    config_component.set("global.bbox", np.array([1.0, 2.0, 3.0, 4.0]))
+    config_component.write()
+    assert skip_msg not in caplog.text
+    config_component.write()
+    assert caplog.text.count(skip_msg) == 1
+    config_component.set("global.name", "changed")
+    config_component.write()
+    assert caplog.text.count(skip_msg) == 1
+    with open(join(tmpdir, "config.yaml")) as f:
+        assert "name: changed" in f.read()
+
+
 def test_get_config_abs_path(tmpdir):
     model = Model(root=tmpdir)
     config_component = ConfigComponent(model)
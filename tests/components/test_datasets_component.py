@@ -33,6 +33,22 @@ def test_model_dataset_sets_correctly(obsda, tmpdir: Path):
     assert list(component.data.keys()) == list(map(str, range(5)))
 
 
+def test_model_dataset_split_dataset_replaces(obsda, tmpdir: Path, caplog):
+    m = Model(root=str(tmpdir), mode="w")
+    component = DatasetsComponent(m)
+    m.add_component("test_dataset", component)
+    ds = obsda.to_dataset(name="a").assign(b=obsda, c=obsda)
+    component.set(data=ds["a"], name="a")
+
+    component.set(data=ds, split_dataset=True)
+    assert list(component.data.keys()) == ["a", "b", "c"]
+    assert "Replacing xarray: a" in caplog.text
+
+    caplog.clear()
+    component.set(data=ds, split_dataset=True)
+    assert "Replacing xarray: a, b, c" in caplog.text
+
+
 def test_model_dataset_reads_and_writes_correctly(obsda, tmpdir: Path):
     model = Model(root=str(tmpdir), mode="w+")
     component = DatasetsComponent(model)
@@ -5,6 +5,7 @@ from typing import cast
 
 import geopandas as gpd
 import numpy as np
+import pytest
 from pyproj import CRS
 from pytest_mock import MockerFixture
 from shapely.geometry import box
@@ -31,6 +32,27 @@ def test_model_set_geoms(tmpdir):
     assert np.allclose(geom_component._region_data.bounds.values, expected_bounds)
 
 
+def test_model_geoms_region_multiple_geoms(tmpdir):
+    model = Model(root=str(tmpdir), mode="w")
+    geom_component = GeomsComponent(model)
+    model.add_component("geom", geom_component)
+
+    geom_component.set(
+        gpd.GeoDataFrame(geometry=[box(0, 0, 1, 1), box(2, 2, 3, 3)], crs=4326), "a"
+    )
+    geom_component.set(gpd.GeoDataFrame(geometry=[box(-1, 1, 0.5, 4)], crs=4326), "b")
+
+    assert np.allclose(geom_component.region.total_bounds, [-1, 0, 3, 4])
+
+
+def test_model_set_geoms_wrong_type(tmpdir):
+    model = Model(root=str(tmpdir), mode="w")
+    geom_component = GeomsComponent(model)
+    model.add_component("geom", geom_component)
+    with pytest.raises(ValueError, match="geom type list not recognized"):
+        geom_component.set([box(0, 0, 1, 1)], "geom")
+
+
 def test_model_read_geoms(tmpdir):
     bbox = box(*[4.221067, 51.949474, 4.471006, 52.073727], ccw=True)
     geom = gpd.GeoDataFrame(geometry=[bbox], crs=4326)
@@ -102,3 +124,45 @@ def test_model_write_geoms(tmpdir):
     region_geom = gpd.read_file(write_path)
 
     assert region_geom.crs.to_epsg() == 3857
+
+
+@pytest.mark.parametrize("ext", ["geojson", "gpkg", "fgb"])
+def test_model_geoms_write_read_roundtrip(tmpdir, ext):
+    filename = f"geoms/{{name}}.{ext}"
+    # single feature, as FlatGeobuf reorders features by its spatial index
+    geom = gpd.GeoDataFrame({"value": [1.5]}, geometry=[box(0, 0, 1, 1)], crs=3857)
+    model = Model(root=str(tmpdir), mode="w")
+    geom_component = GeomsComponent(model, filename=filename)
+    model.add_component("geom", geom_component)
+    geom_component.set(geom, "test_geom")
+    geom_component.write()
+
+    model1 = Model(root=str(tmpdir), mode="r")
+    geom_component1 = GeomsComponent(model1, filename=filename)
+    model1.add_component("geom", geom_component1)
+    geom_component1.read()
+
+    equal, errors = geom_component.test_equal(geom_component1)
+    assert equal, errors
+
+
+def test_model_geoms_test_equal_differences(tmpdir):
+    model = Model(root=str(tmpdir), mode="w")
+    geom_component = GeomsComponent(model)
+    model.add_component("geom", geom_component)
+    geom_component.set(gpd.GeoDataFrame(geometry=[box(0, 0, 2, 2)], crs=4326), "a")
+    geom_component.set(gpd.GeoDataFrame(geometry=[box(0, 0, 1, 1)], crs=4326), "b")
+
+    model1 = Model(root=str(tmpdir), mode="w")
+    geom_component1 = GeomsComponent(model1)
+    model1.add_component("geom", geom_component1)
+    geom_component1.set(
+        gpd.GeoDataFrame(geometry=[box(0, 0, 1, 1), box(1, 1, 2, 2)], crs=4326), "a"
+    )
+
+    equal, errors = geom_component.test_equal(geom_component1)
+    assert not equal
+    assert errors == {
+        "a": "Number of geometries differ: 1 != 2",
+        "b": "Geom not found in other component.",
+    }
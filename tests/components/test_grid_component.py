@@ -33,6 +33,16 @@ def test_set_dataarray(mock_model, hydds):
     assert len(grid_component.data.data_vars) == 1
 
 
+def test_set_ndarray(mock_model, hydds):
+    grid_component = GridComponent(model=mock_model)
+    grid_component.root.is_reading_mode.return_value = False
+    grid_component.set(data=hydds)
+    ndarray = np.ones(hydds.raster.shape, dtype=np.float32)
+    grid_component.set(ndarray, name="ndarray")
+    assert "ndarray" in grid_component.data.data_vars
+    assert grid_component.data["ndarray"].dims == hydds.raster.dims
+
+
 def test_set_raise_errors(mock_model, hydds):
     grid_component = GridComponent(model=mock_model)
     grid_component.root.is_reading_mode.return_value = False
@@ -50,6 +60,25 @@ def test_set_raise_errors(mock_model, hydds):
         grid_component.set(ndarray, name="ndarray")
 
 
+def test_region_cached(mock_model, hydds):
+    grid_component = GridComponent(model=mock_model)
+    grid_component.root.is_reading_mode.return_value = False
+    grid_component.set(data=hydds)
+    region = grid_component.region
+    cache = grid_component._region_cache
+    assert np.allclose(region.total_bounds, hydds.raster.bounds)
+    # modifying the returned region in place does not affect the grid region
+    region.to_crs(3857, inplace=True)
+    assert grid_component._region_cache is cache
+    assert grid_component.region.crs == hydds.raster.crs
+    assert np.allclose(grid_component.region.total_bounds, hydds.raster.bounds)
+    # new bounds invalidate the cached region
+    shifted = hydds.assign_coords(x=hydds["x"] + 1)
+    grid_component._data = shifted
+    assert np.allclose(grid_component.region.total_bounds, shifted.raster.bounds)
+    assert grid_component._region_cache is not cache
+
+
 def test_write(
     mock_model, tmpdir, caplog: pytest.LogCaptureFixture, mocker: MockerFixture
 ):
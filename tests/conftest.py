@@ -59,17 +59,21 @@ def test_settings(tmp_path: Path) -> Generator[Settings, None, None]:
     SETTINGS.cache_root = SETTINGS.model_fields["cache_root"].default
 
 
-@pytest.fixture(autouse=True)
-def _local_catalog_eps(monkeypatch, PLUGINS):
-    """Set entrypoints to local predefined catalogs."""
+def _set_local_catalog_eps(monkeypatch: pytest.MonkeyPatch, plugins: Plugins) -> None:
     cat_root = Path(__file__).parent.parent / "data" / "catalogs"
-    for name, cls in PLUGINS.catalog_plugins.items():
+    for name, cls in plugins.catalog_plugins.items():
         monkeypatch.setattr(
             f"hydromt.data_catalog.predefined_catalog.{cls.__name__}.base_url",
             str(cat_root / name),
         )
 
 
+@pytest.fixture(autouse=True)
+def _local_catalog_eps(monkeypatch, PLUGINS):
+    """Set entrypoints to local predefined catalogs."""
+    _set_local_catalog_eps(monkeypatch, PLUGINS)
+
+
 @pytest.fixture()
 def example_zarr_file(tmp_dir: Path) -> Path:
     tmp_path: Path = tmp_dir / "0s.zarr"
@@ -106,6 +110,16 @@ def data_catalog(_local_catalog_eps) -> DataCatalog:
     return DataCatalog("artifact_data=v1.0.0")
 
 
+@pytest.fixture()
+def artifact_param_catalog(_local_catalog_eps) -> DataCatalog:
+    """Artifact data and parameter catalog.
+
+    A new catalog is returned for each test, as getting data from it marks the
+    sources as used. The catalog files are parsed once, as yaml reads are cached.
+    """
+    return DataCatalog(data_libs=["artifact_data", DC_PARAM_PATH])
+
+
 @pytest.fixture(scope="session")
 def latest_dd_version_uri():
     cat_root = Path(__file__).parent.parent / "data" / "catalogs" / "deltares_data"
@@ -404,11 +418,16 @@ def ts_extremes():
     return da
 
 
-@pytest.fixture()
-def griduda():
-    bbox = [12.09, 46.49, 12.10, 46.50]  # Piava river
-    data_catalog = DataCatalog(data_libs=["artifact_data"])
-    da = data_catalog.get_rasterdataset("merit_hydro", bbox=bbox, variables="elevtn")
+@pytest.fixture(scope="session")
+def griduda_cached() -> xu.UgridDataArray:
+    # session scoped fixtures are set up before the autouse _local_catalog_eps
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        _set_local_catalog_eps(monkeypatch, Plugins())
+        bbox = [12.09, 46.49, 12.10, 46.50]  # Piava river
+        data_catalog = DataCatalog(data_libs=["artifact_data"])
+        da = data_catalog.get_rasterdataset(
+            "merit_hydro", bbox=bbox, variables="elevtn"
+        )
     gdf_da = da.raster.vector_grid()
     gdf_da["value"] = da.values.flatten()
     gdf_da.index.name = "mesh2d_nFaces"
@@ -419,6 +438,14 @@ def griduda():
     return uda
 
 
+@pytest.fixture()
+def griduda(griduda_cached):
+    # return a copy of the data and grid, as tests may modify it
+    return xu.UgridDataArray(
+        griduda_cached.obj.copy(deep=True), griduda_cached.ugrid.grid.copy()
+    )
+
+
 @pytest.fixture()
 def bbox():
     bbox = [12.05, 45.30, 12.85, 45.65]
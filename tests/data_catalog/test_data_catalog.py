@@ -105,6 +105,28 @@ def test_from_yml_no_root(tmpdir):
     assert cat.root == str(tmpdir)
 
 
+def test_from_yml_cached(tmpdir):
+    source = {"data_type": "GeoDataFrame", "driver": {"name": "pyogrio"}}
+    d = {
+        "meta": {"hydromt_version": ">=1.0a,<2", "root": str(tmpdir)},
+        "a": {"uri": "a.gpkg", **source},
+    }
+    cat_file = join(tmpdir, "cat.yml")
+    with open(cat_file, "w") as f:
+        dump(d, f)
+
+    # parsed content is cached but not modified by reading it twice
+    assert DataCatalog().from_yml(cat_file).sources.keys() == {"a"}
+    assert DataCatalog().from_yml(cat_file).sources.keys() == {"a"}
+    assert _yml_from_uri_or_path(cat_file) == d
+
+    # changing the file invalidates the cache
+    d["b"] = {"uri": "b.gpkg", **source}
+    with open(cat_file, "w") as f:
+        dump(d, f)
+    assert DataCatalog().from_yml(cat_file).sources.keys() == {"a", "b"}
+
+
 def test_parser():
     # valid abs root on windows and linux!
     root = "c:/root" if os.name == "nt" else "/c/root"
@@ -2,6 +2,7 @@
 """Tests for the io submodule."""
 
 import os
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import geopandas as gpd
@@ -20,8 +21,9 @@ from hydromt._io.readers import (
     _open_timeseries_from_table,
     _open_vector,
     _open_vector_from_table,
+    _read_nc,
 )
-from hydromt._io.writers import _write_xy
+from hydromt._io.writers import _write_nc, _write_xy
 
 
 def test_open_vector(tmpdir, df, geodf, world):
@@ -241,3 +243,37 @@ def test_open_mfcsv_by_var(tmpdir, dfs_segmented_by_vars):
         test2 = ds.sel(id=i)["test2"]
         assert np.all(np.equal(test1, np.arange(len(ids)) * int(i))), test1
         assert np.all(np.equal(test2, np.arange(len(ids)) ** int(i))), test2
+
+
+def test_read_nc_chunks(tmpdir):
+    ds = xr.Dataset(
+        {"test": (("y", "x"), np.arange(100, dtype=np.float32).reshape(10, 10))}
+    )
+    ds.to_netcdf(tmpdir.join("test.nc"), encoding={"test": {"chunksizes": (5, 2)}})
+
+    ncs = _read_nc("{name}.nc", Path(tmpdir), chunks={})
+    assert ncs["test"].chunks == ((5, 5), (2, 2, 2, 2, 2))
+    ncs["test"].close()
+
+    ncs = _read_nc("{name}.nc", Path(tmpdir))
+    assert ncs["test"].chunks is None
+    ncs["test"].close()
+
+
+def test_write_nc_chunksizes(tmpdir):
+    da = xr.DataArray(
+        np.arange(100, dtype=np.float32).reshape(10, 10), dims=("y", "x"), name="test"
+    )
+    root = Path(tmpdir)
+    _write_nc({"a": da}, "{name}.nc", root, chunksizes={"y": 5, "x": 20}, compress=True)
+    _write_nc({"b": da.chunk({"y": 2, "x": 5})}, "{name}.nc", root, chunksizes={})
+    _write_nc({"c": da}, "{name}.nc", root, encoding={"test": {"zlib": True}})
+
+    with xr.open_dataset(root / "a.nc") as ds:
+        assert ds["test"].encoding["chunksizes"] == (5, 10)
+        assert ds["test"].encoding["zlib"]
+    with xr.open_dataset(root / "b.nc") as ds:
+        assert ds["test"].encoding["chunksizes"] == (2, 5)
+        assert not ds["test"].encoding["zlib"]
+    with xr.open_dataset(root / "c.nc") as ds:
+        assert ds["test"].encoding["zlib"]
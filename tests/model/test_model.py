@@ -65,6 +65,12 @@ def test_from_dict_simple():
     assert model._region_component_name == "grid"
 
 
+def test_model_custom_attributes():
+    model = Model()
+    model.my_attr = "value"
+    assert model.my_attr == "value"
+
+
 def test_from_dict_multiple_spatials():
     d = {
         "modeltype": "model",
@@ -90,15 +96,31 @@ def test_from_dict_multiple_spatials():
     assert model._region_component_name == "grid2"
 
 
-def test_write_data_catalog_no_used(tmpdir):
-    model = Model(root=join(tmpdir, "model"), data_libs=["artifact_data"])
+def test_model_with_data_catalog():
+    data_catalog = DataCatalog()
+    model = Model(data_catalog=data_catalog)
+    assert model.data_catalog is data_catalog
+    with pytest.raises(ValueError, match="cannot be combined with data_catalog"):
+        Model(data_catalog=data_catalog, data_libs=["artifact_data"])
+
+
+def test_model_test_equal_different_components():
+    model = Model(components={"config": {"type": "ConfigComponent"}})
+    model1 = Model(components={"tables": {"type": "TablesComponent"}})
+    equal, errors = model.test_equal(model1)
+    assert not equal
+    assert errors == {"components": "Components do not match: ['config'] != ['tables']"}
+
+
+def test_write_data_catalog_no_used(tmp_path):
+    model = Model(root=join(tmp_path, "model"), data_libs=["artifact_data"])
     data_lib_path = join(model.root.path, "hydromt_data.yml")
     model.write_data_catalog()
     assert not isfile(data_lib_path)
 
 
-def test_write_data_catalog_single_source(tmpdir):
-    model = Model(root=join(tmpdir, "model"), data_libs=["artifact_data"])
+def test_write_data_catalog_single_source(tmp_path):
+    model = Model(root=join(tmp_path, "model"), data_libs=["artifact_data"])
     data_lib_path = join(model.root.path, "hydromt_data.yml")
     sources = list(model.data_catalog.sources.keys())
     model.data_catalog.get_source(sources[0])._mark_as_used()
@@ -106,8 +128,8 @@ def test_write_data_catalog_single_source(tmpdir):
     assert list(DataCatalog(data_lib_path).sources.keys()) == sources[:1]
 
 
-def test_write_data_catalog_append(tmpdir):
-    model = Model(root=join(tmpdir, "model"), data_libs=["artifact_data"])
+def test_write_data_catalog_append(tmp_path):
+    model = Model(root=join(tmp_path, "model"), data_libs=["artifact_data"])
     data_lib_path = join(model.root.path, "hydromt_data.yml")
     sources = list(model.data_catalog.sources.keys())
     model1 = Model(root=str(model.root.path), data_libs=["artifact_data"], mode="r+")
@@ -119,8 +141,8 @@ def test_write_data_catalog_append(tmpdir):
     assert list(DataCatalog(data_lib_path).sources.keys()) == sources[:2]
 
 
-def test_write_data_catalog_csv(tmpdir):
-    model = Model(root=join(tmpdir, "model"), data_libs=["artifact_data"])
+def test_write_data_catalog_csv(tmp_path):
+    model = Model(root=join(tmp_path, "model"), data_libs=["artifact_data"])
     sources = list(model.data_catalog.sources.keys())
     model.write_data_catalog(used_only=False, save_csv=True)
     assert isfile(join(model.root.path, "hydromt_data.csv"))
@@ -130,9 +152,9 @@ def test_write_data_catalog_csv(tmpdir):
     assert data_catalog_df.iloc[-1, 0] == sources[-1]
 
 
-def test_model_mode_errors_reading_in_write_only(grid_model, tmpdir):
+def test_model_mode_errors_reading_in_write_only(grid_model, tmp_path):
     # write model
-    grid_model.root.set(str(tmpdir), mode="w")
+    grid_model.root.set(str(tmp_path), mode="w")
     grid_model.write()
     with pytest.raises(IOError, match="Model opened in write-only mode"):
         grid_model.read()
@@ -146,9 +168,9 @@ def test_model_mode_errors_writing_in_read_only(grid_model):
 
 
 @pytest.mark.integration()
-def test_grid_model_append(demda, df, tmpdir):
+def test_grid_model_append(demda, df, tmp_path):
     demda.name = "dem"
-    model = Model(mode="w", root=str(tmpdir))
+    model = Model(mode="w", root=str(tmp_path))
 
     config_component = ConfigComponent(model)
     config_component.set("test.data", "dem")
@@ -174,7 +196,7 @@ def test_grid_model_append(demda, df, tmpdir):
 
     # append to model and check if previous data is still there
     demda.name = "dem"
-    model2 = Model(mode="w", root=str(tmpdir))
+    model2 = Model(mode="w", root=str(tmp_path))
 
     config_component = ConfigComponent(model2)
     config_component.set("test.data", "dem")
@@ -217,10 +239,10 @@ def test_grid_model_append(demda, df, tmpdir):
 
 
 @pytest.mark.integration()
-def test_model_build_update(tmpdir, demda, obsda):
+def test_model_build_update(tmp_path, demda, obsda):
     bbox = [12.05, 45.30, 12.85, 45.65]
     model = Model(
-        root=str(tmpdir),
+        root=str(tmp_path),
         mode="w",
         components={"grid": {"type": "GridComponent"}},
         region_component="grid",
@@ -247,21 +269,21 @@ def test_model_build_update(tmpdir, demda, obsda):
 
     # read and update model
     model = Model(
-        root=str(tmpdir),
+        root=str(tmp_path),
         mode="r",
         components={"grid": {"type": "GridComponent"}},
         region_component="grid",
     )
     geoms_component = GeomsComponent(model)
     model.add_component("geoms", geoms_component)
-    model_out = str(tmpdir.join("update"))
+    model_out = str(tmp_path / "update")
     model.update(model_out=model_out, steps=[])  # write only
     assert isdir(join(model_out, "grid")), listdir(model_out)
     assert isfile(join(model_out, "grid", "grid_region.geojson")), listdir(model_out)
 
 
 @pytest.mark.integration()
-def test_model_build_update_with_data(tmpdir, demda, obsda, monkeypatch):
+def test_model_build_update_with_data(tmp_path, demda, obsda, monkeypatch):
     # users will not have a use for `set` in their yaml file because there is
     # nothing they will have access to then that they cat set it to
     # so we want to keep `SpatialDatasetsComponent.set` a non-hydromt-step
@@ -273,7 +295,7 @@ def test_model_build_update_with_data(tmpdir, demda, obsda, monkeypatch):
     # Build model with some data
     bbox = [12.05, 45.30, 12.85, 45.65]
     model = Model(
-        root=str(tmpdir),
+        root=str(tmp_path),
         components={
             "grid": {"type": "GridComponent"},
             "maps": {"type": "SpatialDatasetsComponent", "region_component": "grid"},
@@ -308,7 +330,7 @@ def test_model_build_update_with_data(tmpdir, demda, obsda, monkeypatch):
     )
     # Now update the model
     model = Model(
-        root=str(tmpdir),
+        root=str(tmp_path),
         components={
             "grid": {"type": "GridComponent"},
             "maps": {"type": "SpatialDatasetsComponent", "region_component": "grid"},
@@ -345,9 +367,9 @@ def test_setup_region_geom(grid_model, bbox):
     )
 
 
-def test_setup_region_geom_catalog(grid_model, bbox, tmpdir):
+def test_setup_region_geom_catalog(grid_model, bbox, tmp_path):
     # geom via data catalog
-    region_path = str(tmpdir.join("region.gpkg"))
+    region_path = str(tmp_path / "region.gpkg")
     bbox.to_file(region_path, driver="GPKG")
     grid_model.data_catalog.from_dict(
         {
@@ -364,12 +386,12 @@ def test_setup_region_geom_catalog(grid_model, bbox, tmpdir):
     )
 
 
-def test_setup_region_grid(grid_model, demda, tmpdir):
+def test_setup_region_grid(grid_model, demda, tmp_path):
     # grid
-    grid_path = str(tmpdir.join("grid.tif"))
+    grid_path = str(tmp_path / "grid.tif")
     demda.raster.to_raster(grid_path)
     grid_model.grid.create_from_region({"grid": grid_path})
-    assert np.all(demda.raster.bounds == grid_model.region.total_bounds)
+    assert demda.raster.bounds == tuple(grid_model.region.total_bounds)
 
 
 @pytest.mark.skip(reason="needs fix with hydrography_path?")
@@ -380,9 +402,9 @@ def test_setup_region_basin(model):
 
 
 @pytest.mark.integration()
-def test_maps_setup():
+def test_maps_setup(artifact_param_catalog):
     mod = Model(
-        data_libs=["artifact_data", DC_PARAM_PATH],
+        data_catalog=artifact_param_catalog,
         components={"grid": {"type": "GridComponent"}},
         region_component="grid",
         mode="w",
@@ -418,12 +440,15 @@ def test_maps_setup():
     assert len(mod.maps.data["hydrography"].data_vars) == 2
 
 
-@pytest.mark.integration()
-def test_gridmodel(demda, tmpdir):
+@pytest.fixture(scope="module")
+def written_grid_model(tmp_path_factory: pytest.TempPathFactory) -> Model:
+    """Grid model which is written once for all read-back tests in this module."""
     grid_model = Model(
-        root=str(tmpdir),
-        data_libs=["artifact_data", DC_PARAM_PATH],
-        components={"grid": {"type": "GridComponent"}},
+        root=str(tmp_path_factory.mktemp("grid_model")),
+        components={
+            "grid": {"type": "GridComponent"},
+            "config": {"type": "ConfigComponent"},
+        },
         region_component="grid",
         mode="w",
     )
@@ -438,18 +463,25 @@ def test_gridmodel(demda, tmpdir):
         name="c1",
         nodata=-99.0,
     )
+    grid_model.config.set("header.setting", "value")
+    grid_model.write()
+    return grid_model
+
+
+def test_gridmodel(written_grid_model):
+    grid_model = written_grid_model
     # grid specific attributes
-    assert np.all(grid_model.grid.res == grid_model.grid.data.raster.res)
-    assert np.all(grid_model.grid.bounds == grid_model.grid.data.raster.bounds)
-    assert np.all(grid_model.grid.transform == grid_model.grid.data.raster.transform)
+    assert grid_model.grid.res == grid_model.grid.data.raster.res
+    assert grid_model.grid.bounds == grid_model.grid.data.raster.bounds
+    assert grid_model.grid.transform == grid_model.grid.data.raster.transform
 
-    # write model
-    grid_model.write()
     # read model
     model1 = Model(
-        root=str(tmpdir),
-        data_libs=["artifact_data", DC_PARAM_PATH],
-        components={"grid": {"type": "GridComponent"}},
+        root=str(grid_model.root.path),
+        components={
+            "grid": {"type": "GridComponent"},
+            "config": {"type": "ConfigComponent"},
+        },
         region_component="grid",
         mode="r",
     )
@@ -458,15 +490,28 @@ def test_gridmodel(demda, tmpdir):
     equal, errors = grid_model.test_equal(model1)
     assert equal, errors
 
-    # try update
-    grid_model.root.set(str(join(tmpdir, "update")), mode="w")
-    grid_model.write()
 
-    update_root = str(join(tmpdir, "update"))
+def test_gridmodel_update(written_grid_model, demda, tmp_path):
+    # write the model to a new root, then restore the root for other tests
+    grid_model = written_grid_model
+    root = grid_model.root.path
+    update_root = str(tmp_path / "update")
+    grid_model.root.set(update_root, mode="w")
+    try:
+        grid_model.write()
+    finally:
+        grid_model.root.set(root, mode="w")
+    assert isfile(join(update_root, "grid", "grid.nc"))
+    assert isfile(join(update_root, "config.yaml"))
+    assert isfile(join(update_root, "hydromt.log"))
+
+    # try update
     model1 = Model(
         root=update_root,
-        data_libs=["artifact_data", DC_PARAM_PATH],
-        components={"grid": {"type": "GridComponent"}},
+        components={
+            "grid": {"type": "GridComponent"},
+            "config": {"type": "ConfigComponent"},
+        },
         region_component="grid",
         mode="r+",
     )
@@ -505,10 +550,10 @@ def test_setup_grid_from_bbox_aligned(grid_model):
     assert np.all(np.round(grid_model.grid.data.raster.bounds, 2) == bbox)
 
 
-def test_setup_grid_from_wrong_kind_no_mask(grid_model):
+def test_setup_grid_from_wrong_kind_no_mask(grid_model, artifact_param_catalog):
     bbox = [12.05, 45.30, 12.85, 45.65]
     grid_model_tmp = Model(
-        data_libs=["artifact_data", DC_PARAM_PATH],
+        data_catalog=artifact_param_catalog,
         components={"grid": {"type": "GridComponent"}},
         region_component="grid",
     )
@@ -723,16 +768,16 @@ def test_grid_model_geodataframe_fraction(grid_model):
     assert "water_frac" in grid_model.grid.data
 
 
-def test_vectormodel(vector_model, tmpdir, mocker: MockerFixture, geodf):
+def test_vectormodel(vector_model, tmp_path, mocker: MockerFixture, geodf):
     # write model
-    vector_model.root.set(str(tmpdir), mode="w")
+    vector_model.root.set(str(tmp_path), mode="w")
     vector_model.write()
     # read model
     region_component = mocker.Mock(spec_set=SpatialModelComponent)
     region_component.test_equal.return_value = (True, {})
     region_component.region = geodf
     model1 = Model(
-        root=str(tmpdir),
+        root=str(tmp_path),
         mode="r",
         region_component="area",
         components={
@@ -746,7 +791,7 @@ def test_vectormodel(vector_model, tmpdir, mocker: MockerFixture, geodf):
     assert equal, errors
 
 
-def test_vectormodel_vector(vector_model_no_defaults, tmpdir, geoda):
+def test_vectormodel_vector(vector_model_no_defaults, tmp_path, geoda):
     # test set vector
     testds = vector_model_no_defaults.vector.data.copy()
     vector_component = cast(VectorComponent, vector_model_no_defaults.vector)
@@ -784,7 +829,7 @@ def test_vectormodel_vector(vector_model_no_defaults, tmpdir, geoda):
 
     # test write vector
     vector_component.set(gdf)
-    vector_model_no_defaults.root.set(str(tmpdir), mode="w")
+    vector_model_no_defaults.root.set(str(tmp_path), mode="w")
     # netcdf+geojson --> tested in test_vectormodel
     # netcdf only
     vector_component.write(filename="vector/vector_full.nc", geometry_filename=None)
@@ -807,7 +852,7 @@ def test_vectormodel_vector(vector_model_no_defaults, tmpdir, geoda):
     )
 
     # test read vector
-    vector_model1 = Model(root=str(tmpdir), mode="r")
+    vector_model1 = Model(root=str(tmp_path), mode="r")
     vector_model1.add_component("vector", VectorComponent(vector_model1))
     # netcdf only
     vector_model1.vector.read(filename="vector/vector_full.nc", geometry_filename=None)
@@ -878,11 +923,11 @@ def test_setup_mesh_from_bbox(mesh_model):
     assert mesh_model.mesh.data.ugrid.grid.n_node == 136
 
 
-def test_setup_mesh_from_geom(mesh_model, tmpdir):
+def test_setup_mesh_from_geom(mesh_model, artifact_param_catalog, tmp_path):
     bbox = [12.05, 45.30, 12.85, 45.65]
     dummy_mesh_model = Model(
-        root=str(tmpdir),
-        data_libs=["artifact_data", DC_PARAM_PATH],
+        root=str(tmp_path),
+        data_catalog=artifact_param_catalog,
         components={"mesh": {"type": "MeshComponent"}},
         region_component="mesh",
     )
@@ -923,7 +968,9 @@ def test_setup_mesh_from_mesh(mesh_model, griduda):
         "vito_2015", grid_name="mesh2d", resampling_method="mode"
     )
 
-    assert np.all(griduda.ugrid.total_bounds == mesh_model.mesh.region.total_bounds)
+    assert tuple(griduda.ugrid.total_bounds) == tuple(
+        mesh_model.mesh.region.total_bounds
+    )
     assert mesh_model.mesh.data.ugrid.grid.n_node == 169
 
 
@@ -1002,9 +1049,9 @@ def test_initialize_model_with_grid_component():
     assert isinstance(m.grid, GridComponent)
 
 
-def test_write_multiple_components(mocker: MockerFixture, tmpdir: Path):
+def test_write_multiple_components(mocker: MockerFixture, tmp_path: Path):
     m = Model(
-        root=str(tmpdir),
+        root=str(tmp_path),
     )
     foo = mocker.Mock(spec_set=ModelComponent)
     bar = mocker.Mock(spec_set=ModelComponent)
@@ -1045,11 +1092,11 @@ def test_read_calls_components(mocker: MockerFixture):
     foo.read.assert_called_once()
 
 
-def test_build_two_components_writes_one(mocker: MockerFixture, tmpdir: Path):
+def test_build_two_components_writes_one(mocker: MockerFixture, tmp_path: Path):
     foo = mocker.Mock(spec_set=ModelComponent)
     foo.write.__ishydromtstep__ = True
     bar = mocker.Mock(spec_set=ModelComponent)
-    m = Model(root=str(tmpdir))
+    m = Model(root=str(tmp_path))
     m.add_component("foo", foo)
     m.add_component("bar", bar)
     assert m.foo is foo
@@ -1061,9 +1108,9 @@ def test_build_two_components_writes_one(mocker: MockerFixture, tmpdir: Path):
     foo.write.assert_called_once()  # foo was written, because it was specified in steps
 
 
-def test_build_write_disabled_does_not_write(mocker: MockerFixture, tmpdir: Path):
+def test_build_write_disabled_does_not_write(mocker: MockerFixture, tmp_path: Path):
     foo = mocker.Mock(spec_set=ModelComponent)
-    m = Model(root=str(tmpdir))
+    m = Model(root=str(tmp_path))
     m.add_component("foo", foo)
 
     m.build(steps=[], write=False)
@@ -1071,8 +1118,8 @@ def test_build_write_disabled_does_not_write(mocker: MockerFixture, tmpdir: Path
     foo.write.assert_not_called()
 
 
-def test_build_non_existing_step(tmpdir: Path):
-    m = Model(root=str(tmpdir))
+def test_build_non_existing_step(tmp_path: Path):
+    m = Model(root=str(tmp_path))
 
     with pytest.raises(KeyError):
         m.build(steps=[{"foo": {}}])
@@ -1089,12 +1136,12 @@ def test_add_component_duplicate_throws(mocker: MockerFixture):
 
 
 def test_update_empty_model_with_region_none_throws(
-    tmpdir: Path, mocker: MockerFixture
+    tmp_path: Path, mocker: MockerFixture
 ):
     (foo,) = _patch_plugin_components(mocker, SpatialModelComponent)
     foo.region = None
     m = Model(
-        root=str(tmpdir), components={"foo": {"type": SpatialModelComponent.__name__}}
+        root=str(tmp_path), components={"foo": {"type": SpatialModelComponent.__name__}}
     )
     with pytest.raises(
         ValueError, match="Model region not found, setup model using `build` first."
@@ -1102,8 +1149,8 @@ def test_update_empty_model_with_region_none_throws(
         m.update()
 
 
-def test_update_in_read_mode_without_out_folder_throws(tmpdir: Path):
-    m = Model(root=str(tmpdir), mode="r")
+def test_update_in_read_mode_without_out_folder_throws(tmp_path: Path):
+    m = Model(root=str(tmp_path), mode="r")
     with pytest.raises(
         ValueError,
         match='"model_out" directory required when updating in "read-only" mode.',
@@ -1112,17 +1159,17 @@ def test_update_in_read_mode_without_out_folder_throws(tmpdir: Path):
 
 
 def test_update_in_read_mode_with_out_folder_sets_to_write_mode(
-    tmpdir: Path, mocker: MockerFixture
+    tmp_path: Path, mocker: MockerFixture
 ):
     (region,) = _patch_plugin_components(mocker, SpatialModelComponent)
     m = Model(
-        root=str(tmpdir),
+        root=str(tmp_path),
         mode="r",
         components={"region": {"type": SpatialModelComponent.__name__}},
     )
     assert region.region is m.region
 
-    m.update(model_out=str(tmpdir / "out"))
+    m.update(model_out=str(tmp_path / "out"))
 
     assert m.root.is_writing_mode()
     assert not m.root.is_override_mode()
@@ -139,3 +139,13 @@ def test_root_overwrite_deletes_old_log(tmpdir):
     assert "hey!" not in second_log_str, second_log_str
     assert exists(path)
     assert exists(join(path, "hydromt.log"))
+
+
+def test_same_root_keeps_log_handler(tmpdir):
+    main_logger = getLogger("hydromt")
+    path = join(tmpdir, "one")
+    root = ModelRoot(path, "w")
+    handlers = [h for h in main_logger.handlers if isinstance(h, FileHandler)]
+
+    root.set(path, "r")
+    assert [h for h in main_logger.handlers if isinstance(h, FileHandler)] == handlers